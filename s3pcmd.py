@@ -20,37 +20,98 @@
 S3P command line tool.
 """
 
+from __future__ import annotations
+
 import click
-import errno
 import enum
-import fnmatch
-import hashlib
-import json
-import multiprocessing
-import optparse
-import os
-import random
-import re
-import shlex
-import socket
-import sys
-import io
 import itertools as it
+import queue
+import re
 import threading
-import time
-import traceback
-import types
-from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
 from functools import lru_cache
 
 
-import pytz
 from datetime import datetime, timedelta
 from loguru import logger
-from typing import Type, Iterator, List, NamedTuple, Dict, Union, IO
-from boto3_type_annotations.s3 import Client, ServiceResource, Bucket
-from boto3_type_annotations.s3.waiter import BucketExists
-from boto3_type_annotations.s3.paginator import ListObjectsV2
+from typing import TYPE_CHECKING, Type, Iterator, List, NamedTuple, Dict, Optional, Tuple, Union, IO
+
+if TYPE_CHECKING:
+    # annotations only, boto3 is imported on first use through S3BotoClient
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
+    from boto3_type_annotations.s3 import Client, ServiceResource, Bucket
+    from boto3_type_annotations.s3.paginator import ListObjectsV2
+
+_MULTISLASH_RE = re.compile(r"//+")
+# marks the end of the items produced by _prefetch
+_DONE = object()
+
+
+def _put_unless_stopped(buffer: queue.Queue, entry, stop: threading.Event) -> bool:
+    """
+    Put entry on a bounded queue, giving up once stop is set so a producer
+    never blocks forever after its consumer stopped iterating.
+    """
+    while not stop.is_set():
+        try:
+            buffer.put(entry, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _prefetch(items: Iterator, maxsize: int = 4) -> Iterator:
+    """
+    Iterate items from a background thread, keeping up to maxsize of them
+    buffered so the producer's I/O overlaps with the consumer's work.
+    Errors raised by the producer are re-raised in the consumer.
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(entry: Tuple) -> bool:
+        return _put_unless_stopped(buffer, entry, stop)
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((_DONE, e))
+        else:
+            put((_DONE, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _map_bounded(executor: Executor, fn, jobs: Iterator, max_pending: int) -> None:
+    """
+    Run fn over jobs on the executor, pulling the next job only while fewer
+    than max_pending are outstanding so jobs are never materialized up front.
+    Waits for all of them and re-raises the first failure.
+    """
+    pending = set()
+    for job in jobs:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        pending.add(executor.submit(fn, job))
+    for future in wait(pending).done:
+        future.result()
 
 
 class S3Path(object):
@@ -59,16 +120,20 @@ class S3Path(object):
         otherwise it is assumed to be an object in S3
     """
 
-    S3PATH_PATTERN = re.compile(r"(s3[n]?://)([^/]+)[/]?(.*)")
+    __slots__ = ("proto", "bucket", "path", "s3_bucket")
 
     def __init__(self, uri: str):
         self.proto = "s3"
-        try:
-            _, self.bucket, self.path = S3Path.S3PATH_PATTERN.match(uri).groups()
+        offset = S3Path._bucket_offset(uri)
+        if offset == -1:
+            raise RuntimeError("Invalid S3 URI: {uri}".format(uri=uri))
+        slash = uri.find("/", offset)
+        if slash == -1:
+            self.bucket, self.path = uri[offset:], ""
+        else:
             # normalizing the path to remove multiple / in prefix if exists
-            self.path = S3Path.normalize_path(self.path)
-        except:
-            raise RuntimeError("Invliad S3 URI: %{uri}".format(uri=uri))
+            self.bucket = uri[offset:slash]
+            self.path = S3Path.normalize_path(uri[slash + 1 :])
         self.s3_bucket: Bucket = S3BotoClient.get_bucket(self.bucket)
 
     def __str__(self) -> str:
@@ -78,12 +143,16 @@ class S3Path(object):
 
     @classmethod
     def normalize_path(cls, uri:str) -> str:
-        # return uri.replace(r"/\/\/+/g", "/")
-        return re.sub(r"\/\/+", "/", uri)
+        return _MULTISLASH_RE.sub("/", uri)
 
     def __eq__(self, other: "S3Path") -> bool:
+        if not isinstance(other, S3Path):
+            return NotImplemented
         return self.path == other.path and self.bucket == other.bucket
 
+    def __hash__(self) -> int:
+        return hash((self.bucket, self.path))
+
     def is_file(self) -> bool:
         return not self.path.endswith("/")
 
@@ -95,16 +164,17 @@ class S3Path(object):
             Body=body,
         )
 
-    def ls(self, recursive=True, page_size: int = 100, max_items: int = 1_000_000) -> Iterator[Dict]:
-        s3 = S3BotoClient.get_client()
-        paginator: ListObjectsV2 = s3.get_paginator("list_objects_v2")
+    def ls(self, recursive=True, page_size: int = 1000, max_items: int = 1_000_000) -> Iterator[Dict]:
+        paginator: ListObjectsV2 = S3BotoClient._list_paginator()
         operation_parameters = {"Bucket": self.bucket, "Prefix": self.path}
         if not recursive:
             operation_parameters.update(Delimiter='/')
-        for page_iterator in paginator.paginate(
+        pages = paginator.paginate(
             **operation_parameters,
             PaginationConfig={"MaxItems": max_items, "PageSize": page_size},
-        ):
+        )
+        # the next page is requested while the caller works on the current one
+        for page_iterator in _prefetch(pages):
             try:
                 contents = page_iterator.get("Contents", page_iterator.get('CommonPrefixes'))
             except KeyError:
@@ -116,6 +186,86 @@ class S3Path(object):
                 # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.list_objects_v2
                 yield obj
 
+    def _shard_pages(self, workers: int, min_shards: int) -> Optional[Iterator[Dict]]:
+        """
+        Prepares a sharded operation run by workers threads.  Returns the pages
+        of the '/' delimited listing of the path, each holding the objects
+        directly under the path and the common prefixes one level below it,
+        or None if the first page has fewer than min_shards common prefixes.
+      """
+        # one request per shard worker, plus the top level listing
+        S3BotoClient.reserve_connections(workers + 1)
+        paginator: ListObjectsV2 = S3BotoClient._list_paginator()
+        # full pages, enough prefixes to decide on sharding from the first one
+        pages = iter(
+            paginator.paginate(
+                Bucket=self.bucket,
+                Prefix=self.path,
+                Delimiter="/",
+                PaginationConfig={"PageSize": 1000},
+            )
+        )
+        first_page = next(pages, {})
+        if len(first_page.get("CommonPrefixes", [])) < min_shards:
+            return None
+        return it.chain([first_page], pages)
+
+    def ls_parallel(
+        self, page_size: int = 1000, max_workers: int = 16, min_shards: int = 2
+    ) -> Iterator[Dict]:
+        """
+        Recursive listing that runs one paginator per common prefix below the
+        path concurrently.  Objects from different prefixes are interleaved, so
+        the listing order is not preserved.
+        Falls back to ls if the first page of the delimited listing has fewer
+        than min_shards common prefixes.
+      """
+        top_pages = self._shard_pages(max_workers, min_shards)
+        if top_pages is None:
+            yield from self.ls(page_size=page_size)
+            return
+
+        paginator: ListObjectsV2 = S3BotoClient._list_paginator()
+        # bounded so fast shards wait for a slow consumer instead of buffering the listing
+        pages = queue.Queue(maxsize=max_workers * 2)
+        stop = threading.Event()
+
+        def list_shard(prefix: str) -> None:
+            try:
+                for page in paginator.paginate(
+                    Bucket=self.bucket,
+                    Prefix=prefix,
+                    PaginationConfig={"PageSize": page_size},
+                ):
+                    if not _put_unless_stopped(pages, page.get("Contents", []), stop):
+                        return
+            finally:
+                # None marks the shard as done, even if listing failed
+                _put_unless_stopped(pages, None, stop)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            try:
+                # top level pages are streamed, shards start as their prefix is listed
+                for page in top_pages:
+                    futures += [
+                        executor.submit(list_shard, obj["Prefix"])
+                        for obj in page.get("CommonPrefixes", [])
+                    ]
+                    yield from page.get("Contents", [])
+                remaining = len(futures)
+                while remaining:
+                    page = pages.get()
+                    if page is None:
+                        remaining -= 1
+                        continue
+                    yield from page
+            finally:
+                # let the shards still running stop early if the caller stops iterating
+                stop.set()
+        for future in futures:
+            future.result()
+
     def rmr(self) -> None:
         """
         this is a recursive remove of objects that matches the prefix path in the bucket.
@@ -123,34 +273,170 @@ class S3Path(object):
       """
         self.s3_bucket.objects.filter(Prefix=self.path).delete()
 
-    def cp(self, dest_path: "S3Path", excludes: List[str] = ["_SUCCESS"]) -> None:
+    def rmr_parallel(self, workers: int = 16) -> None:
+        """
+        Parallel version of rmr, each common prefix below the path is listed and
+        deleted by its own worker in DeleteObjects batches of up to 1000 keys.
+        Objects directly under the path, e.g. a flat prefix of part files, are
+        deleted one listed page per batch on the same workers.
+        Use it with caution.
+      """
+        # always sharded, flat prefixes still get parallel quiet batches
+        top_pages = self._shard_pages(workers, min_shards=0)
+
+        s3 = S3BotoClient.get_client()
+        paginator: ListObjectsV2 = S3BotoClient._list_paginator()
+
+        def delete(keys: List[str]) -> None:
+            response = s3.delete_objects(
+                Bucket=self.bucket,
+                # quiet mode only reports the keys that failed to delete
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+            errors = response.get("Errors")
+            if errors:
+                raise RuntimeError(
+                    "Failed to delete {count} objects from s3://{bucket}, first error: {error}".format(
+                        count=len(errors), bucket=self.bucket, error=errors[0]
+                    )
+                )
+
+        def delete_shard(prefix: str) -> None:
+            # pages hold at most 1000 keys, the DeleteObjects limit
+            for page in paginator.paginate(
+                Bucket=self.bucket, Prefix=prefix, PaginationConfig={"PageSize": 1000}
+            ):
+                keys = [obj["Key"] for obj in page.get("Contents", [])]
+                if keys:
+                    delete(keys)
+
+        def jobs() -> Iterator[Tuple]:
+            # top level pages are streamed, their objects are deleted one page per batch
+            for page in top_pages:
+                for obj in page.get("CommonPrefixes", []):
+                    yield delete_shard, obj["Prefix"]
+                keys = [obj["Key"] for obj in page.get("Contents", [])]
+                if keys:
+                    yield delete, keys
+
+        def run(job: Tuple) -> None:
+            fn, arg = job
+            fn(arg)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            _map_bounded(executor, run, jobs(), workers * 2)
+
+    def cp(
+        self,
+        dest_path: "S3Path",
+        excludes: List[str] = ["_SUCCESS"],
+        max_workers: int = 32,
+    ) -> None:
         """
         Copy objects from current S3Path object to another S3Path object. 
         Assume both bucket exists already and the source.
         After copying the bucket owner have full control of the copied data.
         The excludes must be a postfix string
+        Copies are issued concurrently from a pool of max_workers threads,
+        large objects are further split into parallel part copies.
+        Objects whose name starts with _ (e.g. _SUCCESS) are copied last,
+        once every other object is in place.
       """
-        # TODO: push any key starts with _ to a queue before the rest of the objects are copied
-        for obj in self.ls():
-            if any([obj["Key"].endswith(excluded) for excluded in excludes]):
-                continue
-            key = obj["Key"]
-            from_resource = {"Bucket": self.bucket, "Key": key}
-            new_key = dest_path.path + key.replace(self.path, "")
-            logger.debug(
-                "creating new object s3://{bucket}/{prefix} from s3://{old_bucket}/{old_prefix}".format(
+        # every copy worker may run up to max_concurrency part copies of a large object
+        S3BotoClient.reserve_connections(
+            max_workers * S3BotoClient.TRANSFER_CONFIG.max_concurrency
+        )
+        # fetch the bucket again, the pool may have grown since dest_path was created
+        dest_bucket = S3BotoClient.get_bucket(dest_path.bucket)
+
+        # str.endswith checks all the postfixes of a tuple in one call
+        suffixes = tuple(excludes)
+        src_bucket, src_prefix, dst_prefix = self.bucket, self.path, dest_path.path
+        src_len = len(src_prefix)
+        markers: List[Tuple[Dict, str]] = []
+
+        def copy_jobs() -> Iterator[Tuple[Dict, str]]:
+            for obj in self.ls():
+                key = obj["Key"]
+                if key.endswith(suffixes):
+                    continue
+                # listing by Prefix guarantees every key starts with the source path
+                assert key.startswith(src_prefix)
+                from_resource = {"Bucket": src_bucket, "Key": key}
+                new_key = dst_prefix + key[src_len:]
+                # formatted by loguru only if a sink accepts debug records
+                logger.debug(
+                    "creating new object s3://{bucket}/{prefix} from s3://{old_bucket}/{old_prefix}",
                     bucket=dest_path.bucket,
                     prefix=new_key,
-                    old_bucket=self.bucket,
+                    old_bucket=src_bucket,
                     old_prefix=key,
                 )
-            )
-            dest_path.s3_bucket.copy(
+                if key.rpartition("/")[2].startswith("_"):
+                    markers.append((from_resource, new_key))
+                    continue
+                yield from_resource, new_key
+
+        def copy(job: Tuple[Dict, str]) -> None:
+            from_resource, new_key = job
+            dest_bucket.copy(
                 from_resource,
                 Key=new_key,
                 ExtraArgs={"ACL": "bucket-owner-full-control"},
+                Config=S3BotoClient.TRANSFER_CONFIG,
             )
 
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            _map_bounded(executor, copy, copy_jobs(), max_workers * 2)
+            _map_bounded(executor, copy, iter(markers), max_workers * 2)
+
+    async def cp_async(
+        self,
+        dest_path: "S3Path",
+        excludes: List[str] = ["_SUCCESS"],
+        max_concurrency: int = 64,
+    ) -> None:
+        """
+        Asynchronous variant of cp running every copy on a single event loop.
+        Requires the optional aioboto3 dependency (pip install s3pcmd[async]).
+        Each key is copied with a single CopyObject request, so source objects
+        must be smaller than 5GB.
+        As with cp, objects whose name starts with _ are copied last.
+      """
+        import asyncio
+        import aioboto3
+        from botocore.config import Config
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        suffixes = tuple(excludes)
+
+        async def copy(s3, key: str) -> None:
+            new_key = dest_path.path + key[len(self.path) :]
+            async with semaphore:
+                await s3.copy_object(
+                    CopySource={"Bucket": self.bucket, "Key": key},
+                    Bucket=dest_path.bucket,
+                    Key=new_key,
+                    ACL="bucket-owner-full-control",
+                )
+
+        markers: List[str] = []
+        config = Config(max_pool_connections=max_concurrency)
+        async with aioboto3.Session().client("s3", config=config) as s3:
+            paginator = s3.get_paginator("list_objects_v2")
+            async for page in paginator.paginate(Bucket=self.bucket, Prefix=self.path):
+                keys = []
+                for obj in page.get("Contents", []):
+                    key = obj["Key"]
+                    if key.endswith(suffixes):
+                        continue
+                    if key.rpartition("/")[2].startswith("_"):
+                        markers.append(key)
+                    else:
+                        keys.append(key)
+                await asyncio.gather(*[copy(s3, key) for key in keys])
+            await asyncio.gather(*[copy(s3, key) for key in markers])
+
     def mv(self, to_path: "S3Path", excludes: List[str] = []) -> None:
         """
         Copy objects from current S3Path object to another S3Path object.
@@ -163,10 +449,22 @@ class S3Path(object):
         self.cp(to_path, excludes=excludes)
         self.rmr()
 
+    @staticmethod
+    def _bucket_offset(uri: str) -> int:
+        """Index where the bucket name starts in uri, -1 if uri is not a S3 URL"""
+        if uri.startswith("s3://"):
+            offset = 5
+        elif uri.startswith("s3n://"):
+            offset = 6
+        else:
+            return -1
+        # bucket name can not be empty
+        return offset if len(uri) > offset and uri[offset] != "/" else -1
+
     @staticmethod
     def is_valid(uri: str) -> bool:
         """Check if given uri is a valid S3 URL"""
-        return S3Path.S3PATH_PATTERN.match(uri) != None
+        return S3Path._bucket_offset(uri) != -1
 
 
 @enum.unique
@@ -219,18 +517,25 @@ class S3ListContent(NamedTuple):
 # {DATETIMEID-1} for previous day of the current DATETIMEID
 # {DATETIMEID+1} for next day of the current DATETIMEID
 class S3DatePath(S3Path):
+    __slots__ = ("_path_lst", "_params")
+
     PARAM_PATTERN = re.compile(r".*{(DATE(TIME)?ID)(([-+])(\d+))?}.*")
+    # formats produced by _extract_value without strftime, checked against it in the tests
     DATE_STR = "%Y-%m-%d"
     DATETIME_STR = "%Y-%m-%d_%H-%M-%S"
 
     def __init__(self, uri: str):
         super(S3DatePath, self).__init__(uri)
-        self._path_lst = [p for p in self.path.split("/") if p.strip() != ""]
+        path_lst = [p for p in self.path.split("/") if p.strip() != ""]
         if self.path[-1] == "/":
-            self._path_lst.append("")
-        self._params = self._parse_params(self._path_lst)
+            path_lst.append("")
+        # kept as a tuple so it can key the _parse_params and _resolve caches
+        self._path_lst = tuple(path_lst)
+        self._params = S3DatePath._parse_params(self._path_lst)
 
-    def _parse_params(self, path_lst: List[str]) -> List[S3DateParam]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_params(path_lst: Tuple[str, ...]) -> Tuple[S3DateParam, ...]:
         params = []
         for idx, val in enumerate(path_lst):
             # TODO: this heuristic might not work for complicated string
@@ -239,63 +544,103 @@ class S3DatePath(S3Path):
                 dtype, sign = DateType[dtype], DateOp.from_str(sign)
                 value = int(value) if value else 0
                 params.append(S3DateParam._make([idx, dtype, sign, value]))
-        return params
+        return tuple(params)
 
     def resolve_dateid(self, dt: datetime) -> str:
+        return S3DatePath._resolve(self.proto, self.bucket, self._path_lst, dt)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _resolve(proto: str, bucket: str, path_lst: Tuple[str, ...], dt: datetime) -> str:
         resolved_lst = [
-            S3DateValue._make(self._extract_value(param, dt)) for param in self._params
+            S3DateValue._make(S3DatePath._extract_value(param, dt))
+            for param in S3DatePath._parse_params(path_lst)
         ]
+        # resolve on a copy, the parsed path must stay intact for the next date
+        parts = list(path_lst)
         for el in resolved_lst:
-            self._path_lst[el.idx] = self._path_lst[el.idx].replace(el.token, el.value)
+            parts[el.idx] = parts[el.idx].replace(el.token, el.value)
         return "{proto}://{fullpath}".format(
-            proto=self.proto, fullpath="/".join([self.bucket, "/".join(self._path_lst)])
+            proto=proto, fullpath="/".join([bucket, "/".join(parts)])
         )
 
-    def _compute_offset(self, dt: datetime, op: DateOp, value: int) -> datetime:
+    @staticmethod
+    def _compute_offset(dt: datetime, op: DateOp, value: int) -> datetime:
         td = timedelta(days=value)
         return dt - td if op == DateOp.MINUS else dt + td
 
-    def _reconstruct_match_token(self, param: Type[S3DateParam]) -> str:
+    @staticmethod
+    def _reconstruct_match_token(param: Type[S3DateParam]) -> str:
         lst = [param.dt.name]
         if param.sign in (DateOp.PLUS, DateOp.MINUS):
             lst.append("+" if param.sign == DateOp.PLUS else "-")
             lst.append(str(param.value))
         return "{{{token}}}".format(token="".join(lst))
 
-    def _extract_value(self, param: Type[S3DateParam], dt: datetime) -> List:
+    @staticmethod
+    def _extract_value(param: Type[S3DateParam], dt: datetime) -> List:
         ts = (
             dt
             if param.sign == DateOp.NONE
-            else self._compute_offset(dt, param.sign, param.value)
-        )
-        ts_str = (
-            ts.strftime(S3DatePath.DATE_STR)
-            if param.dt == DateType.DATEID
-            else ts.strftime(S3DatePath.DATETIME_STR)
+            else S3DatePath._compute_offset(dt, param.sign, param.value)
         )
-        token = self._reconstruct_match_token(param)
+        # formatting the fields directly skips strftime parsing its format string
+        if param.dt == DateType.DATEID:
+            ts_str = f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}"
+        else:
+            ts_str = f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}_{ts.hour:02d}-{ts.minute:02d}-{ts.second:02d}"
+        token = S3DatePath._reconstruct_match_token(param)
         return [param.idx, token, ts_str]
 
 
+def _format_call(func, args, kargs) -> str:
+    return "%s(%s)" % (
+        func.__name__,
+        ", ".join(
+            [repr(p) for p in args]
+            + ["%s=%s" % (k, repr(v)) for (k, v) in list(kargs.items())]
+        ),
+    )
+
+
 def log_calls(func):
     """Decorator to log debug function calls."""
 
     def wrapper(*args, **kargs):
-        callStr = "%s(%s)" % (
-            func.__name__,
-            ", ".join(
-                [repr(p) for p in args]
-                + ["%s=%s" % (k, repr(v)) for (k, v) in list(kargs.items())]
-            ),
-        )
-        logger.debug(f">> {callStr}")
+        # lazy messages only build the reprs if a sink accepts debug records
+        def call_str():
+            return _format_call(func, args, kargs)
+
+        logger.opt(lazy=True).debug(">> {}", call_str)
         ret = func(*args, **kargs)
-        logger.debug(f"<< {callStr}: {ret}")
+        logger.opt(lazy=True).debug("<< {}: {}", call_str, lambda: ret)
         return ret
 
     return wrapper
 
 
+class _LazyClassAttribute(object):
+    """
+    Class attribute computed by the decorated function on first access and
+    then stored on the class, so boto3 is only imported once it is needed.
+    """
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.lock = threading.Lock()
+
+    def __set_name__(self, owner, name):
+        self.owner, self.name = owner, name
+
+    def __get__(self, instance, owner):
+        with self.lock:
+            value = self.owner.__dict__[self.name]
+            if value is self:
+                value = self.resolve(self.owner)
+                setattr(self.owner, self.name, value)
+        return value
+
+
 class S3BotoClient(object):
     """
     S3BotoClient is a pure client that only deals with S3 paths from source and destination.
@@ -307,17 +652,58 @@ class S3BotoClient(object):
   """
 
     # Encapsulate boto3 interface intercept all API calls.
-    boto3 = __import__("boto3")  # version >= 1.3.1
-    botocore = __import__("botocore")
+    @_LazyClassAttribute
+    def boto3(cls):
+        import boto3  # version >= 1.26.0
+
+        return boto3
+
+    @_LazyClassAttribute
+    def botocore(cls):
+        import botocore.exceptions
+
+        return botocore
+
+    # boto3 already splits copies above 8 MiB into parallel UploadPartCopy requests,
+    # this uses 16 MiB parts and 16 threads instead of the default 8 MiB and 10.
+    @_LazyClassAttribute
+    def TRANSFER_CONFIG(cls) -> TransferConfig:
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=16,
+            use_threads=True,
+        )
+
     SUCCESS_FILE = "_SUCCESS"
+    # http connections pooled per client, grown by reserve_connections
+    MAX_POOL_CONNECTIONS = 64
+    _POOL_LOCK = threading.Lock()
+    # adaptive mode backs off client side when S3 starts throttling
+    RETRIES = {"max_attempts": 10, "mode": "adaptive"}
 
     # Exported exceptions.
-    BotoError = boto3.exceptions.Boto3Error
-    ClientError = botocore.exceptions.ClientError
-    NoCredentialsError = botocore.exceptions.NoCredentialsError
+    @_LazyClassAttribute
+    def BotoError(cls):
+        return cls.boto3.exceptions.Boto3Error
+
+    @_LazyClassAttribute
+    def ClientError(cls):
+        return cls.botocore.exceptions.ClientError
+
+    @_LazyClassAttribute
+    def NoCredentialsError(cls):
+        return cls.botocore.exceptions.NoCredentialsError
+
+    @_LazyClassAttribute
+    def InvalidS3PathError(cls):
+        class InvalidS3PathError(cls.BotoError):
+            pass
 
-    class InvalidS3PathError(BotoError):
-        pass
+        InvalidS3PathError.__qualname__ = "S3BotoClient.InvalidS3PathError"
+        return InvalidS3PathError
 
     @classmethod
     @log_calls
@@ -337,7 +723,7 @@ class S3BotoClient(object):
                     )
                 )
             else:
-                s3_path.rmr()
+                s3_path.rmr_parallel()
 
     @classmethod
     @log_calls
@@ -348,22 +734,31 @@ class S3BotoClient(object):
                 "URI: {s3_uri} is invalid format".format(s3_uri=s3_uri)
             )
         s3_path = S3Path(S3DatePath(s3_uri).resolve_dateid(dt=date_id))
-        return list(
-            it.islice(
-                (
-                    S3ListContent._make(
-                        [
-                            obj.get("Key", obj.get('Prefix')),
-                            obj.get("Size", 0),
-                            obj.get("Owner", {}).get("DisplayName", ""),
-                            obj.get("ETag", ''),
-                        ]
-                    )
-                    for obj in s3_path.ls(recursive=recursive)
-                ),
-                limit,
+        contents: List[S3ListContent] = []
+        # a limit of None lists every key
+        if limit == 0:
+            return contents
+        # local bindings, this loop runs once per listed key
+        append, make = contents.append, S3ListContent
+        for obj in s3_path.ls(
+            recursive=recursive,
+            # 1000 is the most keys S3 returns per page, avoid over-fetching small limits
+            page_size=min(limit, 1000) if limit else 1000,
+            max_items=limit,
+        ):
+            get = obj.get
+            owner = get("Owner")
+            append(
+                make(
+                    get("Key") or get("Prefix"),
+                    get("Size", 0),
+                    owner.get("DisplayName", "") if owner else "",
+                    get("ETag", ""),
+                )
             )
-        )
+            if len(contents) == limit:
+                break
+        return contents
 
     @classmethod
     @log_calls
@@ -381,12 +776,45 @@ class S3BotoClient(object):
     @classmethod
     @lru_cache(maxsize=1)
     def get_client(cls) -> Client:
-        return cls.boto3.client("s3")
+        return cls.boto3.client("s3", config=cls._boto_config())
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _list_paginator(cls) -> ListObjectsV2:
+        # paginators keep no state between paginate calls, one is shared by all listings
+        return cls.get_client().get_paginator("list_objects_v2")
 
     @classmethod
     @lru_cache(maxsize=1)
     def _s3_resource(cls, region: str = "us-west-2") -> ServiceResource:
-        return cls.boto3.resource("s3", region_name=region)
+        return cls.boto3.resource(
+            "s3",
+            region_name=region,
+            config=cls._boto_config(),
+        )
+
+    @classmethod
+    def _boto_config(cls) -> Config:
+        from botocore.config import Config
+
+        return Config(
+            max_pool_connections=cls.MAX_POOL_CONNECTIONS,
+            retries=dict(cls.RETRIES),
+            tcp_keepalive=True,
+        )
+
+    @classmethod
+    def reserve_connections(cls, connections: int) -> None:
+        """
+        Make sure the connection pool can serve the given number of concurrent requests.
+        Clients and resources created afterwards get the larger pool.
+        """
+        with cls._POOL_LOCK:
+            if connections > cls.MAX_POOL_CONNECTIONS:
+                cls.MAX_POOL_CONNECTIONS = connections
+                cls.get_client.cache_clear()
+                cls._list_paginator.cache_clear()
+                cls._s3_resource.cache_clear()
 
     @classmethod
     def get_bucket(cls, bucket_name: str) -> Bucket:
@@ -51,7 +51,8 @@ setup(name='s3pcmd',
       url='https://github.com/felixgao/S3PCmd.git',
       py_modules=['s3pcmd'],
       scripts=['s3pcmd.py'], 
-      install_requires=['click', 'boto3>=1.3.1', 'pytz>=2016.4', 'loguru>=0.3.0', 'boto3_type_annotations>=0.3.1'],
+      install_requires=['click', 'boto3>=1.26.0', 'loguru>=0.3.0', 'boto3_type_annotations>=0.3.1'],
+      extras_require={'async': ['aioboto3']},
       entry_points={
         'console_scripts': [
             's3pcmd = s3pcmd:main',
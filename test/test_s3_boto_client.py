@@ -1,7 +1,11 @@
+import os
+import subprocess
+import sys
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from datetime import datetime
-from s3pcmd import S3BotoClient
+from s3pcmd import S3BotoClient, S3Path
 import boto3
 from botocore.stub import Stubber
 from moto import mock_s3
@@ -13,9 +17,11 @@ def create_test_bucket_and_keys(n: int, s3_bucket:str, s3_prefix: str, content:s
     res = boto3.resource('s3')
     if res.Bucket(s3_bucket).creation_date is None:
        res.create_bucket(Bucket=s3_bucket)
-    for key in ["{prefix}/key{idx:03}".format(prefix=s3_prefix, idx=idx) for idx in range(n) ]:
-        object = res.Object(s3_bucket, key)
-        object.put(Body=content.encode('utf-8'))
+    bucket = res.Bucket(s3_bucket)
+    body = content.encode('utf-8')
+    keys = ["{prefix}/key{idx:03}".format(prefix=s3_prefix, idx=idx) for idx in range(n) ]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda key: bucket.put_object(Key=key, Body=body), keys))
 
 @pytest.fixture() 
 @mock_s3 
@@ -47,6 +53,12 @@ def invalid_uri():
         10,
         10,
         10),
+        ("s3://{bucket}/{prefix}/",
+        BUCKET,
+        "foo/test",
+        10,
+        None,
+        10),
     ]
 )
 @mock_s3
@@ -173,3 +185,50 @@ def test_boto_client_cp_single_object(uri_template: str, src_bucket: str, src_pr
         assert src.size == dst.size
         assert src.owner == dst.owner
         assert src.etag == dst.etag
+
+@pytest.mark.parametrize(
+    'connections, expected_pool_size', [
+        (8, 64),
+        (512, 512),
+    ]
+)
+def test_boto_client_reserve_connections(monkeypatch, connections: int, expected_pool_size: int):
+    monkeypatch.setattr(S3BotoClient, "MAX_POOL_CONNECTIONS", 64)
+    S3BotoClient.get_client.cache_clear()
+    S3BotoClient._list_paginator.cache_clear()
+    S3BotoClient.reserve_connections(connections)
+    assert S3BotoClient.MAX_POOL_CONNECTIONS == expected_pool_size
+    assert S3BotoClient.get_client().meta.config.max_pool_connections == expected_pool_size
+    assert S3BotoClient._list_paginator() is S3BotoClient._list_paginator()
+    S3BotoClient.get_client.cache_clear()
+    S3BotoClient._list_paginator.cache_clear()
+    S3BotoClient._s3_resource.cache_clear()
+
+@mock_s3
+def test_boto_client_cp_reserves_part_copy_connections(monkeypatch):
+    monkeypatch.setattr(S3BotoClient, "MAX_POOL_CONNECTIONS", 64)
+    create_test_bucket_and_keys(1, BUCKET, "foo/test")
+    S3Path("s3://{bucket}/foo/test/".format(bucket=BUCKET)).cp(S3Path("s3://{bucket}/bar/test/".format(bucket=BUCKET)), max_workers=8)
+    # each copy worker may run TRANSFER_CONFIG.max_concurrency part copies at once
+    assert S3BotoClient.MAX_POOL_CONNECTIONS == 8 * S3BotoClient.TRANSFER_CONFIG.max_concurrency
+    assert S3BotoClient._s3_resource().meta.client.meta.config.max_pool_connections == 128
+    S3BotoClient.get_client.cache_clear()
+    S3BotoClient._list_paginator.cache_clear()
+    S3BotoClient._s3_resource.cache_clear()
+
+def test_boto_client_retries_not_mutated():
+    S3BotoClient.get_client.cache_clear()
+    S3BotoClient._s3_resource.cache_clear()
+    # botocore rewrites the retries dict it is given into total_max_attempts
+    S3BotoClient.get_client()
+    S3BotoClient._s3_resource()
+    assert S3BotoClient.RETRIES == {"max_attempts": 10, "mode": "adaptive"}
+    assert S3BotoClient.get_client().meta.config.retries["total_max_attempts"] == 11
+    S3BotoClient.get_client.cache_clear()
+    S3BotoClient._s3_resource.cache_clear()
+
+def test_boto_client_lazy_boto3_import():
+    # a fresh interpreter, this test module already imported boto3
+    code = "import sys, s3pcmd; assert 'boto3' not in sys.modules; s3pcmd.S3BotoClient.InvalidS3PathError; assert 'boto3' in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert issubclass(S3BotoClient.InvalidS3PathError, S3BotoClient.BotoError)
@@ -1,7 +1,7 @@
 import pytest
 from loguru import logger
 from datetime import datetime
-from s3pcmd import S3Path, S3DatePath, S3BotoClient
+from s3pcmd import S3Path, S3DatePath, S3BotoClient, _prefetch
 import boto3
 from botocore.stub import Stubber
 
@@ -26,6 +26,47 @@ def test_s3path_objects(uri: str, expected: str, valid: bool):
         assert s3p.__str__() != expected
 
 
+@pytest.mark.parametrize(
+    'uri, valid, bucket, path', [
+        ("s3://test-bucket/path/p2/", True, "test-bucket", "path/p2/"),
+        ("s3n://test-bucket/path/key000", True, "test-bucket", "path/key000"),
+        ("s3://test-bucket", True, "test-bucket", ""),
+        ("s3://test-bucket/", True, "test-bucket", ""),
+        ("s3://", False, None, None),
+        ("s3:///path", False, None, None),
+        ("s4://test-bucket/path", False, None, None),
+    ]
+)
+def test_s3path_parse_uri(uri: str, valid: bool, bucket: str, path: str):
+    assert S3Path.is_valid(uri) == valid
+    if valid:
+        s3p = S3Path(uri)
+        assert s3p.bucket == bucket
+        assert s3p.path == path
+    else:
+        with pytest.raises(RuntimeError):
+            S3Path(uri)
+
+
+@pytest.mark.parametrize(
+    'uri, is_file', [
+        ("s3://test-bucket/path/key000", True),
+        ("s3://test-bucket/path/p2/", False),
+    ]
+)
+def test_s3path_is_file(uri: str, is_file: bool):
+    assert S3Path(uri).is_file() == is_file
+
+
+def test_s3path_hash():
+    s3p = S3Path("s3://test-bucket/path/p2/")
+    assert s3p == S3Path("s3://test-bucket/path//p2/")
+    assert s3p != S3Path("s3://test-bucket/path/p3/")
+    assert s3p != "s3://test-bucket/path/p2/"
+    assert len({s3p, S3Path("s3://test-bucket/path/p2/"), S3DatePath("s3://test-bucket/path/p2/")}) == 1
+    assert not hasattr(s3p, "__dict__")
+
+
 @pytest.mark.parametrize(
     'uri, expected', [
         ("s3://test-bucket/path/p2/{DATEID}", 
@@ -49,3 +90,41 @@ def test_s3pathdate_objects(uri: str, expected: str):
     s3p = S3DatePath(uri)
     dt = datetime(2017, 11, 28, 23, 55, 59, 342380)
     assert expected == s3p.resolve_dateid(dt)
+
+
+
+def test_s3pathdate_resolve_multiple_dates():
+    s3p = S3DatePath("s3://test-bucket/path/{DATEID}/{DATETIMEID+1}/")
+    first = s3p.resolve_dateid(datetime(2017, 11, 28, 23, 55, 59))
+    second = s3p.resolve_dateid(datetime(2019, 1, 2, 3, 4, 5))
+    assert first == "s3://test-bucket/path/2017-11-28/2017-11-29_23-55-59/"
+    assert second == "s3://test-bucket/path/2019-01-02/2019-01-03_03-04-05/"
+
+
+def test_s3pathdate_resolve_cached():
+    dt = datetime(2017, 11, 28, 23, 55, 59)
+    first = S3DatePath("s3://test-bucket/cached/{DATEID-1}/").resolve_dateid(dt)
+    hits = S3DatePath._resolve.cache_info().hits
+    second = S3DatePath("s3://test-bucket/cached/{DATEID-1}/").resolve_dateid(dt)
+    assert first == second == "s3://test-bucket/cached/2017-11-27/"
+    assert S3DatePath._resolve.cache_info().hits == hits + 1
+
+@pytest.mark.parametrize('dt', [datetime(2017, 11, 28, 23, 55, 59), datetime(2019, 1, 2, 3, 4, 5)])
+def test_s3pathdate_formats(dt: datetime):
+    s3p = S3DatePath("s3://test-bucket/path/{DATEID}/{DATETIMEID}/")
+    expected = "s3://test-bucket/path/{}/{}/".format(dt.strftime(S3DatePath.DATE_STR), dt.strftime(S3DatePath.DATETIME_STR))
+    assert s3p.resolve_dateid(dt) == expected
+
+def test_prefetch_items():
+    assert list(_prefetch(iter(range(10)), maxsize=2)) == list(range(10))
+
+
+def test_prefetch_exception():
+    def failing_pages():
+        yield 1
+        raise RuntimeError("listing failed")
+
+    items = _prefetch(failing_pages())
+    assert next(items) == 1
+    with pytest.raises(RuntimeError):
+        next(items)
@@ -1,4 +1,10 @@
+import asyncio
+import itertools
 import pytest
+import socket
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from loguru import logger
 from datetime import datetime
 from s3pcmd import S3Path, S3BotoClient
@@ -13,8 +19,24 @@ def create_test_bucket_and_keys(n: int, s3path: Type[S3Path]):
     res = boto3.resource('s3')
     res.create_bucket(Bucket=s3path.bucket)
     bucket = S3BotoClient.get_bucket(s3path.bucket)
-    for key in ["{prefix}/key{idx:03}".format(prefix=s3path.path, idx=idx) for idx in range(n) ]:
-        bucket.put_object(Key=key, Body=b'')
+    keys = ["{prefix}/key{idx:03}".format(prefix=s3path.path, idx=idx) for idx in range(n) ]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda key: bucket.put_object(Key=key, Body=b''), keys))
+
+@contextmanager
+def record_s3_calls():
+    """Records (operation, params) of every call made by the cached s3 clients"""
+    calls = []
+    def record(model, params, **kwargs):
+        calls.append((model.name, params))
+    clients = [S3BotoClient.get_client(), S3BotoClient._s3_resource().meta.client]
+    for client in clients:
+        client.meta.events.register('before-parameter-build.s3', record)
+    try:
+        yield calls
+    finally:
+        for client in clients:
+            client.meta.events.unregister('before-parameter-build.s3', record)
 
 def add_excluded_files(s3pth: Type[S3Path], excludes:List[str] = []):
     for exclude in excludes:
@@ -82,6 +104,49 @@ def test_s3path_ls_non_recursive_objects(uri: str, expected: int):
     if s3_path.is_file():
         assert items[0]['Key'] == s3_path.path
 
+@pytest.mark.parametrize(
+    'uri, shards, file_count', [
+        ("s3://{bucket}/prefix/2019-09-01/".format(bucket=BUCKET),
+        3,
+        5
+        ),
+        ("s3://{bucket}/prefix/2019-09-01/".format(bucket=BUCKET),
+        1,
+        5
+        )
+    ]
+)
+@mock_s3
+def test_s3path_ls_parallel_objects(uri: str, shards: int, file_count: int):
+    res = boto3.resource('s3')
+    res.create_bucket(Bucket=BUCKET)
+    s3_path = S3Path(uri)
+    bucket = S3BotoClient.get_bucket(s3_path.bucket)
+    bucket.put_object(Key="{prefix}_SUCCESS".format(prefix=s3_path.path), Body=b'')
+    for shard in range(shards):
+        for key in ["{prefix}part{shard}/key{idx:03}".format(prefix=s3_path.path, shard=shard, idx=idx) for idx in range(file_count)]:
+            bucket.put_object(Key=key, Body=b'')
+    with record_s3_calls() as calls:
+        items = sorted(obj['Key'] for obj in s3_path.ls_parallel(page_size=2))
+    assert len(items) == shards * file_count + 1
+    assert items == sorted(obj['Key'] for obj in s3_path.ls())
+    sharded = any(name == 'ListObjectsV2' and params['Prefix'] == s3_path.path + 'part0/' for name, params in calls)
+    assert sharded == (shards > 1)
+
+@mock_s3
+def test_s3path_ls_parallel_stop_early():
+    res = boto3.resource('s3')
+    res.create_bucket(Bucket=BUCKET)
+    s3_path = S3Path("s3://{bucket}/prefix/2019-09-01/".format(bucket=BUCKET))
+    bucket = S3BotoClient.get_bucket(s3_path.bucket)
+    for shard in range(4):
+        for idx in range(10):
+            bucket.put_object(Key="{prefix}part{shard}/key{idx:03}".format(prefix=s3_path.path, shard=shard, idx=idx), Body=b'')
+    # a single worker with a 2 page buffer, the shards must not block once the caller stops
+    items = s3_path.ls_parallel(page_size=1, max_workers=1)
+    assert len(list(itertools.islice(items, 3))) == 3
+    items.close()
+
 @pytest.mark.parametrize(
     'from_path, to_path, file_count, excludes', [
         (
@@ -109,6 +174,37 @@ def test_s3path_cp_objects(from_path: Type[S3Path], to_path: Type[S3Path], file_
     assert len(orig_items) == file_count + len(excludes)
     assert len(items) == file_count
 
+@mock_s3
+def test_s3path_cp_repeated_prefix_objects():
+    from_path = S3Path("s3://{bucket}/prefix/".format(bucket=BUCKET))
+    to_path = S3Path("s3://{bucket}/new_prefix/".format(bucket=BUCKET))
+    res = boto3.resource('s3')
+    res.create_bucket(Bucket=BUCKET)
+    bucket = S3BotoClient.get_bucket(BUCKET)
+    bucket.put_object(Key="prefix/data/prefix/key000", Body=b'')
+    from_path.cp(to_path)
+    assert [obj['Key'] for obj in to_path.ls()] == ["new_prefix/data/prefix/key000"]
+
+@mock_s3
+def test_s3path_cp_markers_last(monkeypatch):
+    from_path = S3Path("s3://{bucket}/prefix/2019-09-01/".format(bucket=BUCKET))
+    to_path = S3Path("s3://{bucket}/new_prefix/2019-09-01/".format(bucket=BUCKET))
+    res = boto3.resource('s3')
+    res.create_bucket(Bucket=BUCKET)
+    bucket = S3BotoClient.get_bucket(BUCKET)
+    for key in ["_metadata", "_SUCCESS", "key000", "key001", "sub/_index"]:
+        bucket.put_object(Key=from_path.path + key, Body=b'')
+    copied = []
+
+    class RecordingBucket:
+        def copy(self, from_resource, Key, **kwargs):
+            bucket.copy(from_resource, Key=Key, **kwargs)
+            copied.append(Key)
+
+    monkeypatch.setattr(S3BotoClient, "get_bucket", classmethod(lambda cls, name: RecordingBucket()))
+    from_path.cp(to_path, max_workers=1)
+    assert copied == [to_path.path + key for key in ["key000", "key001", "_metadata", "sub/_index"]]
+
 @pytest.mark.parametrize(
     'from_path, to_path, file_count, excludes', [
         (
@@ -157,6 +253,56 @@ def test_s3path_rmr_objects(from_path: Type[S3Path], file_count: int):
     assert len(orig_items) == file_count
     assert len(items) == 0
 
+@pytest.mark.parametrize(
+    'from_path, shards, file_count', [
+        (
+            S3Path("s3://{bucket}/prefix/2019-09-01/".format(bucket=BUCKET)),
+            3,
+            5
+        ),
+        (
+            S3Path("s3://{bucket}/prefix/2019-09-01/".format(bucket=BUCKET)),
+            1,
+            5
+        )
+    ]
+)
+@mock_s3
+def test_s3path_rmr_parallel_objects(from_path: Type[S3Path], shards: int, file_count: int):
+    res = boto3.resource('s3')
+    res.create_bucket(Bucket=from_path.bucket)
+    bucket = S3BotoClient.get_bucket(from_path.bucket)
+    bucket.put_object(Key="{prefix}_SUCCESS".format(prefix=from_path.path), Body=b'')
+    bucket.put_object(Key="prefix/2019-09-02/key000", Body=b'')
+    for shard in range(shards):
+        for key in ["{prefix}part{shard}/key{idx:03}".format(prefix=from_path.path, shard=shard, idx=idx) for idx in range(file_count)]:
+            bucket.put_object(Key=key, Body=b'')
+    orig_items = list(from_path.ls())
+    from_path.rmr_parallel(workers=4)
+    items = list(from_path.ls())
+    assert len(orig_items) == shards * file_count + 1
+    assert len(items) == 0
+    assert len(list(S3Path("s3://{bucket}/prefix/".format(bucket=BUCKET)).ls())) == 1
+
+@mock_s3
+def test_s3path_rmr_parallel_flat_prefix():
+    from_path = S3Path("s3://{bucket}/prefix/2019-09-01/".format(bucket=BUCKET))
+    res = boto3.resource('s3')
+    res.create_bucket(Bucket=BUCKET)
+    bucket = S3BotoClient.get_bucket(BUCKET)
+    keys = ["{prefix}part-{idx:05}".format(prefix=from_path.path, idx=idx) for idx in range(1500)]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda key: bucket.put_object(Key=key, Body=b''), keys))
+    with record_s3_calls() as calls:
+        from_path.rmr_parallel()
+    assert list(from_path.ls()) == []
+    list_calls = Counter((name, params['Prefix']) for name, params in calls if name.startswith('ListObjects'))
+    # the flat prefix is listed once, without falling back to the serial rmr
+    assert list_calls == {('ListObjectsV2', from_path.path): 2}
+    deletes = [params for name, params in calls if name == 'DeleteObjects']
+    assert sorted(len(params['Delete']['Objects']) for params in deletes) == [500, 1000]
+    assert all(params['Delete']['Quiet'] for params in deletes)
+
 @pytest.mark.parametrize(
     'from_path, postfix, content', [
         (
@@ -175,4 +321,33 @@ def test_s3path_put_objects(from_path: Type[S3Path], postfix:str, content:str):
     new_items = list(from_path.ls())
     assert len(orig_items) == 0
     assert len(new_items) == 1
-    assert new_items[0]['Size'] == len(content.encode('utf-8'))
\ No newline at end of file
+    assert new_items[0]['Size'] == len(content.encode('utf-8'))
+
+def test_s3path_cp_async_objects(monkeypatch):
+    pytest.importorskip("aioboto3")
+    moto_server = pytest.importorskip("moto.server")
+    # aiobotocore is not intercepted by mock_s3, serve the requests from a local moto server
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    endpoint_url = "http://127.0.0.1:{port}".format(port=port)
+    try:
+        s3 = boto3.client('s3', endpoint_url=endpoint_url)
+        s3.create_bucket(Bucket="foo-async-test-bucket")
+        for key in ["key000", "part/key001", "_metadata", "_SUCCESS"]:
+            s3.put_object(Bucket="foo-async-test-bucket", Key="prefix/2019-09-01/" + key, Body=b'data')
+        from_path = S3Path("s3://foo-async-test-bucket/prefix/2019-09-01/")
+        to_path = S3Path("s3://foo-async-test-bucket/new_prefix/2019-09-02/")
+        # cp_async resolves the endpoint from the environment like any aioboto3 client
+        monkeypatch.setenv("AWS_ENDPOINT_URL", endpoint_url)
+        asyncio.run(from_path.cp_async(to_path, excludes=["_SUCCESS"]))
+        contents = s3.list_objects_v2(Bucket="foo-async-test-bucket", Prefix=to_path.path)["Contents"]
+        assert sorted(obj["Key"] for obj in contents) == [
+            "new_prefix/2019-09-02/_metadata",
+            "new_prefix/2019-09-02/key000",
+            "new_prefix/2019-09-02/part/key001",
+        ]
+    finally:
+        server.stop()